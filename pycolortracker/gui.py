@@ -5,7 +5,7 @@ from typing import Tuple
 import cv2
 import numpy as np
 import qtawesome as qta
-from PyQt6.QtCore import Qt, pyqtSlot, pyqtSignal, QSettings
+from PyQt6.QtCore import Qt, pyqtSlot, pyqtSignal, QSettings, QPoint
 from PyQt6.QtGui import (QKeySequence, QImage, QPaintEvent, QPainter, QMouseEvent, QPen,
         QDoubleValidator, QCloseEvent, QPixmap, QPalette, QColor)
 from PyQt6.QtWidgets import (QMainWindow, QMenuBar, QApplication, QDialog, QDialogButtonBox,
@@ -15,7 +15,7 @@ from qtrangeslider import QRangeSlider
 
 from . import version
 from .analyzer import Analyzer, PlotType
-from .processor import Processor
+from .processor import Processor, TuningFrame
 from .source import ThreadedSource
 
 
@@ -37,27 +37,33 @@ class MainWindow(QMainWindow):
         self.processor = None
         self.hue = 0
         self.threshold = 20
+        self.tuning_frame = None
+        self.tuning_point = None
 
         layout = QVBoxLayout()
 
         self.label_video_result = QLabel()
         layout.addWidget(self.label_video_result)
+        self.tuning_preview = TuningPreview()
+        self.tuning_preview.point_selected.connect(self.select_tuning_point)
+        self.tuning_preview.hide()
+        layout.addWidget(self.tuning_preview)
 
         layout_threshold = QHBoxLayout()
         label_threshold = QLabel("Schwellwert:")
         layout_threshold.addWidget(label_threshold)
-        slider_threshold = QSlider(Qt.Orientation.Horizontal)
-        slider_threshold.setRange(0, 255)
-        slider_threshold.valueChanged.connect(self.change_threshold)
-        label_threshold.setBuddy(slider_threshold)
-        layout_threshold.addWidget(slider_threshold)
+        self.slider_threshold = QSlider(Qt.Orientation.Horizontal)
+        self.slider_threshold.setRange(0, 255)
+        self.slider_threshold.valueChanged.connect(self.change_threshold)
+        label_threshold.setBuddy(self.slider_threshold)
+        layout_threshold.addWidget(self.slider_threshold)
         layout.addLayout(layout_threshold)
 
         layout_hue = QHBoxLayout()
         label_hue = QLabel("Farbton:")
         layout_hue.addWidget(label_hue)
         self.slider_hue = QSlider(Qt.Orientation.Horizontal)
-        self.slider_hue.setRange(0, 127)
+        self.slider_hue.setRange(0, 179)
         self.slider_hue.valueChanged.connect(self.change_hue)
         self.slider_hue.setValue(0)
         label_hue.setBuddy(self.slider_hue)
@@ -71,6 +77,14 @@ class MainWindow(QMainWindow):
         button_stop = QPushButton(qta.icon("fa.stop"), "Stopp")
         button_stop.clicked.connect(self.stop_processing)
         layout_controls.addWidget(button_stop)
+        self.button_tune = QPushButton(qta.icon("fa.sliders"), "Abstimmen")
+        self.button_tune.setCheckable(True)
+        self.button_tune.toggled.connect(self.toggle_tuning)
+        layout_controls.addWidget(self.button_tune)
+        self.button_suggest = QPushButton(qta.icon("fa.magic"), "Vorschlagen")
+        self.button_suggest.setEnabled(False)
+        self.button_suggest.clicked.connect(self.suggest_tuning)
+        layout_controls.addWidget(self.button_suggest)
         layout.addLayout(layout_controls)
 
         central_widget = QWidget()
@@ -98,6 +112,7 @@ class MainWindow(QMainWindow):
         self.threshold = value
         if self.processor:
             self.processor.threshold = self.threshold
+        self.update_tuning_preview()
     
     @pyqtSlot(int)
     def change_hue(self, value: int) -> None:
@@ -110,6 +125,69 @@ class MainWindow(QMainWindow):
         self.hue = self.slider_hue.value()
         if self.processor:
             self.processor.hue = self.hue
+        self.update_tuning_preview()
+
+    @pyqtSlot(bool)
+    def toggle_tuning(self, checked: bool) -> None:
+        if checked:
+            if not self.source or self.source.isRunning():
+                QMessageBox.information(self, "Abstimmen", "Zum Abstimmen muss eine Quelle ausgewählt und die Verarbeitung gestoppt sein.")
+                self.button_tune.setChecked(False)
+                return
+            video_capture = self.source.video_capture
+            # a recorded video must not lose the frozen frame for the following tracking run
+            seekable = video_capture.get(cv2.CAP_PROP_FRAME_COUNT) > 0
+            if seekable:
+                position = video_capture.get(cv2.CAP_PROP_POS_FRAMES)
+            success, cv_image = video_capture.read()
+            if seekable:
+                video_capture.set(cv2.CAP_PROP_POS_FRAMES, position)
+            if not success:
+                QMessageBox.critical(self, "Fehler", "Aus der Videoquelle konnte kein Bild gelesen werden.")
+                self.button_tune.setChecked(False)
+                return
+            roi_x1, roi_y1, roi_x2, roi_y2 = self.roi
+            cv_image_roi = cv_image[roi_y1:roi_y2, roi_x1:roi_x2]
+            if cv_image_roi.size == 0:
+                QMessageBox.critical(self, "Fehler", "Der ausgewählte Bildausschnitt ist leer.")
+                self.button_tune.setChecked(False)
+                return
+            self.tuning_frame = TuningFrame(cv_image_roi)
+            self.tuning_point = None
+            self.tuning_preview.reset()
+            self.label_video_result.hide()
+            self.tuning_preview.show()
+            self.update_tuning_preview()
+        else:
+            self.tuning_frame = None
+            self.tuning_point = None
+            self.tuning_preview.reset()
+            self.tuning_preview.hide()
+            self.label_video_result.show()
+        self.button_suggest.setEnabled(False)
+
+    @pyqtSlot(QPoint)
+    def select_tuning_point(self, point: QPoint) -> None:
+        self.tuning_point = point
+        self.button_suggest.setEnabled(self.tuning_frame is not None)
+
+    @pyqtSlot()
+    def suggest_tuning(self) -> None:
+        if self.tuning_frame is not None and self.tuning_point is not None:
+            suggestion = self.tuning_frame.suggest(self.tuning_point.x(), self.tuning_point.y())
+            if suggestion is None:
+                QMessageBox.information(self, "Vorschlagen", "Der markierte Bereich enthält keine vom Hintergrund unterscheidbare Farbe.")
+                return
+            hue, threshold = suggestion
+            self.slider_hue.setValue(hue)
+            self.slider_threshold.setValue(threshold)
+
+    def update_tuning_preview(self) -> None:
+        if self.tuning_frame is None:
+            return
+        image, (bbox_x, bbox_y, bbox_w, bbox_h) = self.tuning_frame.preview(self.hue, self.threshold)
+        cv2.rectangle(image, (bbox_x, bbox_y), (bbox_x+bbox_w, bbox_y+bbox_h), (255, 0, 0))
+        self.tuning_preview.update_image(QImage(image.data, image.shape[1], image.shape[0], image.strides[0], QImage.Format.Format_BGR888).copy())
 
     @pyqtSlot()
     def request_quit(self) -> None:
@@ -117,6 +195,7 @@ class MainWindow(QMainWindow):
 
     @pyqtSlot()
     def show_select_source(self) -> None:
+        self.button_tune.setChecked(False)
         if self.source:
             self.source.stop_gracefully()
         dialog = SourceDialog(self.settings)
@@ -156,6 +235,7 @@ class MainWindow(QMainWindow):
     @pyqtSlot()
     def start_processing(self):
         if self.source and not self.source.isRunning():
+            self.button_tune.setChecked(False)
             self.source.start()
 
     @pyqtSlot()
@@ -372,6 +452,40 @@ class SourcePreview(QWidget):
                 painter.drawLine(self.a, self.b)
 
 
+class TuningPreview(QWidget):
+    point_selected = pyqtSignal(QPoint)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._image = None
+        self.point = None
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.point = event.pos()
+            self.point_selected.emit(self.point)
+        self.update()
+
+    def reset(self) -> None:
+        self.point = None
+        self.update()
+
+    @pyqtSlot(QImage)
+    def update_image(self, image: QImage) -> None:
+        self._image = image
+        self.setFixedSize(image.size())
+        self.update()
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        painter = QPainter(self)
+        if self._image:
+            painter.drawImage(self.rect(), self._image)
+            if self.point is not None:
+                painter.setPen(QPen(Qt.GlobalColor.green, 1))
+                radius = TuningFrame.region_radius
+                painter.drawRect(self.point.x() - radius, self.point.y() - radius, 2 * radius, 2 * radius)
+
+
 class AboutDialog(QDialog):
     def __init__(self) -> None:
         super().__init__()
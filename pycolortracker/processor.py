@@ -1,5 +1,5 @@
 from math import floor
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -33,3 +33,69 @@ class Processor:
             for x in prange(width):
                 output[y, x, 0] = (255 - floor(abs(((frame[y, x, 0] + 90 - hue) % 180) - 90) * 2.833)) * frame[y, x, 1] / 255 * frame[y, x, 2] / 255
         return output
+
+
+class TuningFrame:
+    region_radius = 8
+    hue_smoothing = 5
+
+    def __init__(self, frame_bgr_roi: np.ndarray) -> None:
+        self.frame_bgr = np.ascontiguousarray(frame_bgr_roi)
+        self.frame_hsv = cv2.cvtColor(self.frame_bgr, cv2.COLOR_BGR2HSV)
+        self.histogram = cv2.calcHist([self.frame_hsv], [0, 1], None, [180, 256], [0, 180, 0, 256])
+        grayscale = cv2.cvtColor(self.frame_bgr, cv2.COLOR_BGR2GRAY) // 3
+        self.frame_background = cv2.cvtColor(grayscale, cv2.COLOR_GRAY2BGR)
+        self._intensity_hue = None
+        self._intensity = None
+
+    def color_intensity(self, hue: int) -> np.ndarray:
+        # the intensity only depends on the hue, so threshold changes reuse the cached frame
+        if hue != self._intensity_hue:
+            self._intensity = Processor.process_hvs_frame_into_color_intensity(self.frame_hsv, hue)
+            self._intensity_hue = hue
+        return self._intensity
+
+    def mask(self, hue: int, threshold: int) -> np.ndarray:
+        _, mask = cv2.threshold(self.color_intensity(hue), threshold, 255, cv2.THRESH_BINARY)
+        return mask.reshape(self.frame_hsv.shape[:2])
+
+    def preview(self, hue: int, threshold: int) -> Tuple[np.ndarray, Tuple[int, int, int, int]]:
+        mask = self.mask(hue, threshold)
+        image = self.frame_background.copy()
+        np.copyto(image, self.frame_bgr, where=mask[:, :, np.newaxis] > 0)
+        return image, cv2.boundingRect(mask)
+
+    def region(self, x: int, y: int) -> Tuple[slice, slice]:
+        return (
+            slice(max(y - self.region_radius, 0), y + self.region_radius + 1),
+            slice(max(x - self.region_radius, 0), x + self.region_radius + 1),
+        )
+
+    def suggest(self, x: int, y: int) -> Optional[Tuple[int, int]]:
+        region = self.region(x, y)
+        region_histogram = cv2.calcHist([np.ascontiguousarray(self.frame_hsv[region])], [0, 1], None, [180, 256], [0, 180, 0, 256])
+        # weight by saturation (grey pixels have no meaningful hue) and by the share of each bin lying inside
+        # the region (colors that are common in the background get suppressed)
+        distinctiveness = region_histogram / np.maximum(self.histogram, 1)
+        hue_weights = (region_histogram * distinctiveness) @ np.arange(256, dtype="float32")
+        if hue_weights.max() == 0: # colorless region, there is no hue to suggest
+            return None
+        padded = np.concatenate((hue_weights[-self.hue_smoothing:], hue_weights, hue_weights[:self.hue_smoothing]))
+        kernel = self.hue_smoothing + 1 - np.abs(np.arange(-self.hue_smoothing, self.hue_smoothing + 1)) # triangular, keeps the peak centered
+        hue_weights = np.convolve(padded, kernel, "valid") # hue is circular
+        hue = int(np.argmax(hue_weights))
+
+        intensity = self.color_intensity(hue)
+        region_intensity = np.ascontiguousarray(intensity[region][:, :, 0])
+        # the object may cover only part of the region, Otsu separates it from the background around it
+        split, _ = cv2.threshold(region_intensity, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        object_intensity = region_intensity[region_intensity > split]
+        if object_intensity.size == 0: # uniform region
+            object_intensity = region_intensity
+        object_level = np.percentile(object_intensity, 25)
+        background_level = np.median(intensity)
+        if object_level <= background_level + 1: # the clicked color does not stand out from the frame
+            return None
+        # staying above the median ensures the mask never covers most of the frame
+        threshold = int((object_level + background_level) / 2)
+        return hue, threshold
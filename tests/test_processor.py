@@ -0,0 +1,64 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+pytest.importorskip("numba")
+
+from pycolortracker.processor import TuningFrame
+
+
+def hue_distance(a: int, b: int) -> int:
+    return min(abs(a - b), 180 - abs(a - b))
+
+
+def make_frame(blob_bgr, blob_x: int = 50, blob_y: int = 20, size: int = 20) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    frame = rng.integers(80, 120, (100, 120, 3), dtype=np.uint8) # low saturation noise
+    frame[blob_y:blob_y+size, blob_x:blob_x+size] = blob_bgr
+    return frame
+
+
+def test_suggest_finds_blob_hue_and_preview_covers_blob():
+    tuning_frame = TuningFrame(make_frame((0, 200, 0))) # green, OpenCV hue 60
+    hue, threshold = tuning_frame.suggest(60, 30)
+    assert hue_distance(hue, 60) <= 1
+    assert 0 < threshold < 200
+    _, bbox = tuning_frame.preview(hue, threshold)
+    assert bbox == (50, 20, 20, 20)
+
+
+@pytest.mark.parametrize("size, click_x, click_y", [
+    (6, 53, 23), # smaller than the click region
+    (10, 55, 25),
+    (14, 57, 27),
+    (20, 52, 30), # click 2 px inside the left edge
+    (20, 68, 22), # click 2 px inside the top right corner
+    (10, 51, 29), # off-center click on a small blob
+])
+def test_suggest_preview_covers_small_or_off_center_blob(size, click_x, click_y):
+    tuning_frame = TuningFrame(make_frame((0, 200, 0), size=size))
+    suggestion = tuning_frame.suggest(click_x, click_y)
+    assert suggestion is not None
+    assert hue_distance(suggestion[0], 60) <= 1
+    assert tuning_frame.preview(*suggestion)[1] == (50, 20, size, size)
+
+
+def test_suggest_wraps_hue_around_red():
+    tuning_frame = TuningFrame(make_frame((0, 0, 200))) # red, OpenCV hue 0
+    hue, _ = tuning_frame.suggest(60, 30)
+    assert hue_distance(hue, 0) <= 1
+
+
+def test_suggest_clips_region_at_frame_edge():
+    tuning_frame = TuningFrame(make_frame((200, 0, 0), blob_x=0, blob_y=0)) # blue, OpenCV hue 120
+    rows, columns = tuning_frame.region(0, 0)
+    assert rows.start == 0 and columns.start == 0
+    hue, threshold = tuning_frame.suggest(0, 0)
+    assert hue_distance(hue, 120) <= 1
+    _, bbox = tuning_frame.preview(hue, threshold)
+    assert bbox == (0, 0, 20, 20)
+
+
+def test_suggest_returns_none_for_colorless_region():
+    tuning_frame = TuningFrame(np.full((100, 120, 3), 128, dtype=np.uint8))
+    assert tuning_frame.suggest(60, 30) is None